@@ -1,34 +1,38 @@
 """CLI for chat with WhatsApp data."""
 
 import asyncio
+from typing import TYPE_CHECKING
 
 import typer
-from langchain.chat_models import init_chat_model
-from langchain.messages import AIMessage, AIMessageChunk, HumanMessage
-from qdrant_client import AsyncQdrantClient
 
-from whatsvector.agent.agent import create_whatsvector_agent
-from whatsvector.agent.context import WhatsVectorContext
-from whatsvector.agent.state import AgentState
+from whatsvector.common.event_loop import event_loop_factory
 from whatsvector.common.language import SupportedLanguages
 from whatsvector.config.config_file import Config, ConfigFile
 
+if TYPE_CHECKING:
+    from whatsvector.agent.context import WhatsVectorContext
+    from whatsvector.agent.state import AgentState
+
 app = typer.Typer(
     add_completion=True,
 )
 
 
-async def invoke(agent, input_state: AgentState, context: WhatsVectorContext) -> None:
+async def invoke(
+    agent, input_state: "AgentState", context: "WhatsVectorContext"
+) -> str:
     """Process a chunk of AIMessageChunk and return its content."""
-    ai_message = ""
+    from langchain.messages import AIMessageChunk
+
+    parts: list[str] = []
     async for _, data in agent.astream(
         input=input_state, context=context, stream_mode=["messages"]
     ):
         chunk, _ = data
         if isinstance(chunk, AIMessageChunk):
             typer.echo(f"{chunk.content}", nl=False)
-            ai_message += chunk.content
-    return ai_message
+            parts.append(chunk.content)
+    return "".join(parts)
 
 
 @app.command()
@@ -60,24 +64,43 @@ def run(
     ),
 ) -> None:
     """Run the WhatsVector chat agent."""
+    # Validate the model before paying for the heavy imports below.
+    provider, _, model_name = llm_model.partition("/")
+    if not provider or not model_name:
+        raise typer.BadParameter(
+            f"Invalid model '{llm_model}', expected <provider>/<model-name>.",
+            param_hint="'--llm-model'",
+        )
+
+    # Heavy imports are deferred so that `--help` and the other subcommands stay fast.
+    from langchain.chat_models import init_chat_model
+    from langchain.messages import AIMessage, HumanMessage
+    from qdrant_client import AsyncQdrantClient
+
+    from whatsvector.agent.agent import create_whatsvector_agent
+    from whatsvector.agent.context import WhatsVectorContext
+    from whatsvector.agent.state import AgentState
+
     config: Config = ConfigFile(f".whatsvector/{profile}.yaml").load()
 
     qdrant_client = AsyncQdrantClient(
         host=config.qdrant_host,
         port=config.qdrant_port,
+        grpc_port=config.qdrant_grpc_port,
+        prefer_grpc=config.qdrant_prefer_grpc,
         https=config.qdrant_https,
         api_key=config.qdrant_api_key,
         path=config.qdrant_local_path,
     )
-    qdrant_client.set_model(embedding_model_name=config.embedding_model)
 
-    splitted = llm_model.split("/")
-    provider = splitted[0]
-    model_name = "/".join(splitted[1:])
     chat_model = init_chat_model(model=model_name, model_provider=provider)
 
+    # Queries are embedded by the search tools themselves, the client does not
+    # need its own copy of the model.
     context = WhatsVectorContext(
-        qdrant_client=qdrant_client, collection_name=config.collection_name
+        qdrant_client=qdrant_client,
+        collection_name=config.collection_name,
+        embedding_model=config.embedding_model,
     )
     agent = create_whatsvector_agent(
         language=language,
@@ -88,21 +111,28 @@ def run(
     history = []
 
     typer.echo("Welcome to WhatsVector chat! Type 'exit' to quit.")
-    while True:
-        user_input = typer.prompt("You")
-        if user_input.lower() in ["exit", "quit"]:
-            typer.echo("Goodbye!")
-            break
-        history.append(HumanMessage(content=user_input))
-        input_state = AgentState(
-            messages=history,
-            language=language,
-            username=username,
-        )
-        typer.echo("WhatsVector Agent: ", nl=False)
-        ai_message = asyncio.run(invoke(agent, input_state, context))
-        typer.echo("")  # New line after the AI message
-        history.append(AIMessage(content=ai_message))
+    # A single event loop for the whole session, so that the Qdrant client keeps
+    # its connections open between turns.
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        try:
+            while True:
+                user_input = typer.prompt("You")
+                if user_input.lower() in ["exit", "quit"]:
+                    typer.echo("Goodbye!")
+                    break
+                history.append(HumanMessage(content=user_input))
+                input_state = AgentState(
+                    messages=history,
+                    language=language,
+                    username=username,
+                )
+                typer.echo("WhatsVector Agent: ", nl=False)
+                ai_message = runner.run(invoke(agent, input_state, context))
+                typer.echo("")  # New line after the AI message
+                history.append(AIMessage(content=ai_message))
+        finally:
+            # Also on Ctrl-D/Ctrl-C or a failed turn, not only on exit.
+            runner.run(qdrant_client.close())
 
 
 if __name__ == "__main__":
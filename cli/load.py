@@ -4,8 +4,13 @@ import asyncio
 
 import typer
 
+from whatsvector.common.constants import (
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_QDRANT_GRPC_PORT,
+    QuantizationType,
+)
+from whatsvector.common.event_loop import event_loop_factory
 from whatsvector.config.config_file import Config, ConfigFile
-from whatsvector.data.loaders.loader import DEFAULT_EMBEDDING_MODEL, QdrantDataLoader
 
 app = typer.Typer(
     add_completion=True,
@@ -34,6 +39,16 @@ def run(
         "-p",
         help="The Qdrant port number.",
     ),
+    qdrant_grpc_port: int = typer.Option(
+        DEFAULT_QDRANT_GRPC_PORT,
+        "--qdrant-grpc-port",
+        help="The Qdrant gRPC port number.",
+    ),
+    qdrant_prefer_grpc: bool = typer.Option(
+        True,
+        "--qdrant-grpc/--no-qdrant-grpc",
+        help="Whether to use gRPC instead of REST for Qdrant connection.",
+    ),
     qdrant_api_key: str = typer.Option(
         None,
         "--qdrant-api-key",
@@ -57,6 +72,12 @@ def run(
         "-e",
         help="The embedding model to use.",
     ),
+    quantization: QuantizationType = typer.Option(
+        "scalar",
+        "--quantization",
+        "-q",
+        help="Quantization of the vectors, used when the collection is created.",
+    ),
     progress: bool = typer.Option(
         True,
         "--progress/--no-progress",
@@ -70,17 +91,27 @@ def run(
         whatsapp_files (list[str]): List of WhatsApp data file paths.
         qdrant_host (str): The Qdrant host address.
         qdrant_port (int): The Qdrant port number.
+        qdrant_grpc_port (int): The Qdrant gRPC port number.
+        qdrant_prefer_grpc (bool): Whether to use gRPC instead of REST for Qdrant connection.
         qdrant_api_key (str): The Qdrant API key, if required.
         qdrant_https (bool): Whether to use HTTPS for Qdrant connection.
         qdrant_local_path (str): Local path for Qdrant, if provided a
             local instance will be used.
         embedding_model (str): The embedding model to use.
+        quantization (QuantizationType): Quantization of the vectors, used when
+            the collection is created.
         progress (bool): Whether to show a progress bar during data loading.
     """
-    if ConfigFile.exists(profile):
+    # Deferred so that `--help` does not pay for the loader dependencies.
+    from whatsvector.data.loaders.loader import QdrantDataLoader
+
+    profile_exists = ConfigFile.exists(profile)
+    if profile_exists:
         config = ConfigFile(f".whatsvector/{profile}.yaml").load()
         qdrant_host = config.qdrant_host
         qdrant_port = config.qdrant_port
+        qdrant_grpc_port = config.qdrant_grpc_port
+        qdrant_prefer_grpc = config.qdrant_prefer_grpc
         qdrant_api_key = config.qdrant_api_key
         qdrant_https = config.qdrant_https
         qdrant_local_path = config.qdrant_local_path
@@ -91,18 +122,24 @@ def run(
         local_path=qdrant_local_path,
         host=qdrant_host,
         port=qdrant_port,
+        grpc_port=qdrant_grpc_port,
+        prefer_grpc=qdrant_prefer_grpc,
         https=qdrant_https,
         api_key=qdrant_api_key,
         embedding_model=embedding_model,
+        quantization=quantization,
     )
-    asyncio.run(loader.load_data(progress=progress))
+    with asyncio.Runner(loop_factory=event_loop_factory()) as runner:
+        runner.run(loader.load_data(progress=progress))
 
-    if not ConfigFile.exists(profile):
+    if not profile_exists:
         config = ConfigFile(f".whatsvector/{profile}.yaml")
         config.save(
             config=Config(
                 qdrant_host=qdrant_host,
                 qdrant_port=qdrant_port,
+                qdrant_grpc_port=qdrant_grpc_port,
+                qdrant_prefer_grpc=qdrant_prefer_grpc,
                 qdrant_api_key=qdrant_api_key,
                 qdrant_https=qdrant_https,
                 qdrant_local_path=qdrant_local_path,
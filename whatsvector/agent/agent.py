@@ -1,12 +1,42 @@
+from functools import lru_cache
+
 from langchain.agents import create_agent
 from langchain.chat_models import BaseChatModel
 
 from whatsvector.agent.context import WhatsVectorContext
 from whatsvector.agent.state import AgentState
-from whatsvector.agent.tools import qdrant_search
+from whatsvector.agent.tools import qdrant_search, qdrant_search_batch
 from whatsvector.common.language import SupportedLanguages, language_code_to_name
 
+# Default system prompt, the user specific instructions are appended to it.
+_BASE_SYSTEM_PROMPT = (
+    "# Personality and Role"
+    "You are a helpful assistant that provides information based on WhatsApp chat data."
+    "You have access to a vector database containing WhatsApp messages, "
+    "and you can use this data to answer user queries."
+    "In the database each message has metadata including the sender's "
+    "name and the date the message was sent."
+    " Always refer to the messages in the database to provide accurate and "
+    "relevant answers to the user's questions."
+    "Use filters when necessary to narrow down search results based "
+    "on the sender's name or date ranges."
+    "If you cannot find the answer in the database, "
+    "respond with 'I could not find any relevant information in your WhatsApp data,'"
+    "and ask the user if they would like to provide more context or "
+    "rephrase their question."
+    " Do not apply filters unless explicitly instructed by the user."
+    "## Output format"
+    " When providing answers, always include a 'Sources' "
+    "section at the end of your response."
+    " Answer in a conversational and coincise manner."
+    " Do not provide all the retrieved messages, instead synthesize "
+    "the information to directly address the user's query."
+    " The 'Sources' section should list the messages you referenced "
+    "to formulate your answer."
+)
+
 
+@lru_cache(maxsize=32)
 def build_system_prompt(
     custom_system_prompt: str | None, username: str, language: SupportedLanguages
 ) -> str:
@@ -27,35 +57,7 @@ def build_system_prompt(
         _prompt_instance += (
             f" The user prefers to communicate in {language_code_to_name(language)}."
         )
-    if custom_system_prompt:
-        system_prompt = custom_system_prompt + _prompt_instance
-    else:
-        system_prompt = (
-            "# Personality and Role"
-            "You are a helpful assistant that provides information based on WhatsApp chat data."
-            "You have access to a vector database containing WhatsApp messages, "
-            "and you can use this data to answer user queries."
-            "In the database each message has metadata including the sender's "
-            "name and the date the message was sent."
-            " Always refer to the messages in the database to provide accurate and "
-            "relevant answers to the user's questions."
-            "Use filters when necessary to narrow down search results based "
-            "on the sender's name or date ranges."
-            "If you cannot find the answer in the database, "
-            "respond with 'I could not find any relevant information in your WhatsApp data,'"
-            "and ask the user if they would like to provide more context or "
-            "rephrase their question."
-            " Do not apply filters unless explicitly instructed by the user."
-            "## Output format"
-            " When providing answers, always include a 'Sources' "
-            "section at the end of your response."
-            " Answer in a conversational and coincise manner."
-            " Do not provide all the retrieved messages, instead synthesize "
-            "the information to directly address the user's query."
-            " The 'Sources' section should list the messages you referenced "
-            "to formulate your answer." + _prompt_instance
-        )
-    return system_prompt
+    return (custom_system_prompt or _BASE_SYSTEM_PROMPT) + _prompt_instance
 
 
 def create_whatsvector_agent(
@@ -80,7 +82,7 @@ def create_whatsvector_agent(
         context_schema=WhatsVectorContext,
         name="WhatsVector Agent",
         state_schema=AgentState,
-        tools=[qdrant_search],
+        tools=[qdrant_search, qdrant_search_batch],
         system_prompt=system_prompt,
     )
     return agent
@@ -1,5 +1,10 @@
 from dataclasses import dataclass
 
+from whatsvector.common.constants import (
+    DEFAULT_COLLECTION_NAME,
+    DEFAULT_EMBEDDING_MODEL,
+)
+
 try:
     from qdrant_client import AsyncQdrantClient
 except ImportError as e:
@@ -8,14 +13,17 @@ except ImportError as e:
     ) from e
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WhatsVectorContext:
     """
     Context for WhatsVector agent including Qdrant client and collection name.
     Attributes:
         qdrant_client (AsyncQdrantClient): The Qdrant client instance.
         collection_name (str): The name of the Qdrant collection to search.
+        embedding_model (str): The embedding model the collection was built with,
+            queries are embedded with it.
     """
 
     qdrant_client: AsyncQdrantClient
-    collection_name: str = "whatsvector_collection"
+    collection_name: str = DEFAULT_COLLECTION_NAME
+    embedding_model: str = DEFAULT_EMBEDDING_MODEL
@@ -1,35 +1,36 @@
+import asyncio
+from functools import lru_cache
 from typing import Optional
 
 from langchain.tools import ToolRuntime, tool
 
 from whatsvector.agent.context import WhatsVectorContext
+from whatsvector.common.cache import search_cache
+from whatsvector.common.embedding import get_text_embedding
 
+# Cosine similarity above which two queries of a batch share the same search.
+SIMILAR_QUERY_THRESHOLD = 0.97
 
-@tool
-async def qdrant_search(
-    runtime: ToolRuntime[WhatsVectorContext],
-    query: str,
-    top_k: int = 5,
-    filter_by_username: Optional[str] = None,
-    before_date: Optional[str] = None,
-    after_date: Optional[str] = None,
-) -> list[dict]:
-    """Searches a Qdrant collection for the most relevant documents to the query.
 
+# The filters only depend on hashable arguments and are never mutated, so the
+# same validated pydantic objects can be shared across calls.
+@lru_cache(maxsize=128)
+def _build_filter(
+    filter_by_username: Optional[str],
+    before_date: Optional[str],
+    after_date: Optional[str],
+):
+    """
+    Builds the Qdrant filter for the search tools.
     Args:
-        runtime (ToolRuntime[WhatsVectorContext]): The tool runtime with context.
-        query (str): The search query.
-        top_k (int, optional): The number of top results to return. Defaults to 5.
-        filter_by_username (Optional[str], optional): Filter results by username. Defaults to None.
-        before_date (Optional[str], optional): Filter results created before this date (ISO format).
-        after_date (Optional[str], optional): Filter results created after this date (ISO format).
-
+        filter_by_username (Optional[str]): Filter results by username.
+        before_date (Optional[str]): Filter results created before this date (ISO format).
+        after_date (Optional[str]): Filter results created after this date (ISO format).
     Returns:
-        list[dict]: A list of the most relevant documents as dictionaries.
+        models.Filter | None: The filter, or None if no condition is given.
     """
     import qdrant_client.models as models
 
-    # Build the filter conditions
     must_conditions = []
     if filter_by_username:
         must_conditions.append(
@@ -53,18 +54,73 @@ async def qdrant_search(
             )
         )
 
-    query_filter = models.Filter(must=must_conditions) if must_conditions else None
+    return models.Filter(must=must_conditions) if must_conditions else None
 
-    # Perform the search
-    search_result = await runtime.context.qdrant_client.query_points(
-        collection_name=runtime.context.collection_name,
-        query=models.Document(
-            text=query,
-            model=runtime.context.qdrant_client.embedding_model_name,
-        ),
-        limit=top_k,
-        query_filter=query_filter,
+
+@lru_cache(maxsize=1)
+def _search_params():
+    """
+    Builds the Qdrant search params for the search tools.
+    Rescore with the original vectors when the collection is quantized,
+    ignored otherwise.
+    Returns:
+        models.SearchParams: The search params.
+    """
+    import qdrant_client.models as models
+
+    return models.SearchParams(
+        quantization=models.QuantizationSearchParams(rescore=True, oversampling=2.0)
     )
+
+
+def _embed_queries(model_name: str, queries: list[str]):
+    """
+    Embeds the search queries with the same model used to load the data.
+    Args:
+        model_name (str): The name of the embedding model.
+        queries (list[str]): The search queries.
+    Returns:
+        np.ndarray: The query vectors, one row per query.
+    """
+    import numpy as np
+
+    return np.array(list(get_text_embedding(model_name).query_embed(queries)))
+
+
+def _group_similar_queries(vectors, threshold: float = SIMILAR_QUERY_THRESHOLD):
+    """
+    Groups near-duplicate queries by the cosine similarity of their vectors.
+    Args:
+        vectors (np.ndarray): The query vectors, one row per query.
+        threshold (float): Similarity above which two queries are grouped.
+    Returns:
+        list[int]: For each query, the index of the query representing its group.
+    """
+    import numpy as np
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    normalized = vectors / np.clip(norms, 1e-12, None)
+    similarities = normalized @ normalized.T
+
+    representatives = [-1] * len(vectors)
+    for i in range(len(vectors)):
+        if representatives[i] != -1:
+            continue
+        representatives[i] = i
+        for j in np.flatnonzero(similarities[i, i + 1 :] > threshold) + i + 1:
+            if representatives[j] == -1:
+                representatives[j] = i
+    return representatives
+
+
+def _points_to_dicts(points) -> list[dict]:
+    """
+    Converts Qdrant scored points to the dictionaries returned by the tools.
+    Args:
+        points (list[models.ScoredPoint]): The points returned by Qdrant.
+    Returns:
+        list[dict]: The points as dictionaries.
+    """
     return [
         {
             "id": point.id,
@@ -72,5 +128,134 @@ async def qdrant_search(
             "when": point.payload.get("when"),
             "content": point.payload.get("content"),
         }
-        for point in search_result.points
+        for point in points
+    ]
+
+
+@tool
+async def qdrant_search(
+    runtime: ToolRuntime[WhatsVectorContext],
+    query: str,
+    top_k: int = 5,
+    filter_by_username: Optional[str] = None,
+    before_date: Optional[str] = None,
+    after_date: Optional[str] = None,
+) -> list[dict]:
+    """Searches a Qdrant collection for the most relevant documents to the query.
+
+    Args:
+        runtime (ToolRuntime[WhatsVectorContext]): The tool runtime with context.
+        query (str): The search query.
+        top_k (int, optional): The number of top results to return. Defaults to 5.
+        filter_by_username (Optional[str], optional): Filter results by username. Defaults to None.
+        before_date (Optional[str], optional): Filter results created before this date (ISO format).
+        after_date (Optional[str], optional): Filter results created after this date (ISO format).
+
+    Returns:
+        list[dict]: A list of the most relevant documents as dictionaries.
+    """
+    # Follow-up questions in a chat often repeat the same search.
+    cache_key = (
+        runtime.context.collection_name,
+        query,
+        top_k,
+        filter_by_username,
+        before_date,
+        after_date,
+    )
+    cached = search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
+    vectors = await asyncio.to_thread(
+        _embed_queries, runtime.context.embedding_model, [query]
+    )
+
+    # Perform the search
+    search_result = await runtime.context.qdrant_client.query_points(
+        collection_name=runtime.context.collection_name,
+        query=vectors[0].tolist(),
+        limit=top_k,
+        query_filter=_build_filter(filter_by_username, before_date, after_date),
+        search_params=_search_params(),
+    )
+    results = _points_to_dicts(search_result.points)
+    search_cache.set(cache_key, results)
+    return list(results)
+
+
+@tool
+async def qdrant_search_batch(
+    runtime: ToolRuntime[WhatsVectorContext],
+    queries: list[str],
+    top_k: int = 5,
+    filter_by_username: Optional[str] = None,
+    before_date: Optional[str] = None,
+    after_date: Optional[str] = None,
+) -> list[list[dict]]:
+    """Searches a Qdrant collection for several queries at once, prefer it to
+    multiple qdrant_search calls when more than one search is needed.
+
+    Args:
+        runtime (ToolRuntime[WhatsVectorContext]): The tool runtime with context.
+        queries (list[str]): The search queries.
+        top_k (int, optional): The number of top results to return per query. Defaults to 5.
+        filter_by_username (Optional[str], optional): Filter results by username. Defaults to None.
+        before_date (Optional[str], optional): Filter results created before this date (ISO format).
+        after_date (Optional[str], optional): Filter results created after this date (ISO format).
+
+    Returns:
+        list[list[dict]]: For each query, in order, the most relevant documents as dictionaries.
+    """
+    import qdrant_client.models as models
+
+    cache_keys = [
+        (
+            runtime.context.collection_name,
+            query,
+            top_k,
+            filter_by_username,
+            before_date,
+            after_date,
+        )
+        for query in queries
     ]
+    results = [search_cache.get(cache_key) for cache_key in cache_keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    if missing:
+        vectors = await asyncio.to_thread(
+            _embed_queries,
+            runtime.context.embedding_model,
+            [queries[i] for i in missing],
+        )
+        # Near-duplicate queries ("who said X", "who mentioned X") would return
+        # the same points, only one search is run for each group of them.
+        representatives = _group_similar_queries(vectors)
+        searched = sorted(set(representatives))
+
+        # All the remaining searches are sent in a single round trip.
+        query_filter = _build_filter(filter_by_username, before_date, after_date)
+        search_params = _search_params()
+        responses = await runtime.context.qdrant_client.query_batch_points(
+            collection_name=runtime.context.collection_name,
+            requests=[
+                models.QueryRequest(
+                    query=vectors[k].tolist(),
+                    limit=top_k,
+                    filter=query_filter,
+                    params=search_params,
+                    with_payload=True,
+                )
+                for k in searched
+            ],
+        )
+        found = {
+            k: _points_to_dicts(response.points)
+            for k, response in zip(searched, responses)
+        }
+        for k, i in enumerate(missing):
+            results[i] = found[representatives[k]]
+            search_cache.set(cache_keys[i], results[i])
+
+    return [list(result) for result in results]
@@ -0,0 +1,65 @@
+"""In-memory caches shared across the WhatsVector project."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """
+    Least recently used cache whose entries expire after a time to live.
+    Attributes:
+        maxsize (int): Maximum number of entries kept in the cache.
+        ttl (float): Number of seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Get the value cached for a key.
+        Args:
+            key (Hashable): The cache key.
+        Returns:
+            Any | None: The cached value, or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if full.
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Results of the agent search tool, cleared whenever new data is loaded.
+search_cache = TTLCache(maxsize=256, ttl=300.0)
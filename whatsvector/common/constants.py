@@ -0,0 +1,11 @@
+"""Constants shared across the WhatsVector project."""
+
+from typing import Literal
+
+# The default embedding model is jinaai/jina-embeddings-v3 because it's good for multilingual data.
+DEFAULT_EMBEDDING_MODEL = "jinaai/jina-embeddings-v3"
+DEFAULT_COLLECTION_NAME = "whatsvector_collection"
+DEFAULT_QDRANT_GRPC_PORT = 6334
+
+# Quantization applied to the vectors of newly created Qdrant collections.
+QuantizationType = Literal["none", "scalar", "binary"]
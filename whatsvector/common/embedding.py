@@ -0,0 +1,35 @@
+"""Embedding models shared across the WhatsVector project."""
+
+import threading
+
+# Loaded models by name, a model takes seconds and up to a few GB to load.
+_MODELS: dict = {}
+_MODELS_LOCK = threading.Lock()
+
+
+def get_text_embedding(model_name: str):
+    """
+    Get the fastembed model with the given name, loading it only once per process.
+    It is safe to call from several threads, the first caller loads the model
+    while the others wait for it.
+    Args:
+        model_name (str): The name of the embedding model.
+    Returns:
+        TextEmbedding: The embedding model instance.
+    """
+    model = _MODELS.get(model_name)
+    if model is not None:
+        return model
+
+    try:
+        from fastembed import TextEmbedding
+    except ImportError as e:
+        raise ImportError(
+            "fastembed is not installed. Please install it with 'pip install fastembed'"
+        ) from e
+    with _MODELS_LOCK:
+        model = _MODELS.get(model_name)
+        if model is None:
+            model = TextEmbedding(model_name=model_name)
+            _MODELS[model_name] = model
+    return model
@@ -0,0 +1,18 @@
+"""Event loop selection for the WhatsVector CLI commands."""
+
+import asyncio
+from collections.abc import Callable
+
+
+def event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    Get the loop factory to pass to asyncio.Runner.
+    Returns:
+        Callable[[], asyncio.AbstractEventLoop] | None: uvloop's loop factory if
+            it is installed, None for the default asyncio event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
@@ -2,6 +2,15 @@ from typing import Literal
 
 SupportedLanguages = Literal["en", "es", "fr", "de", "it", "pt"]
 
+_LANG_MAP = {
+    "en": "English",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+}
+
 
 def language_code_to_name(code: SupportedLanguages) -> str:
     """
@@ -11,12 +20,4 @@ def language_code_to_name(code: SupportedLanguages) -> str:
     Returns:
         str: The full language name (e.g., "English", "Spanish").
     """
-    language_map = {
-        "en": "English",
-        "es": "Spanish",
-        "fr": "French",
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-    }
-    return language_map.get(code, "English")
+    return _LANG_MAP.get(code, "English")
@@ -1,15 +1,44 @@
 """Configuration file handling for WhatsVector application."""
 
+import os
+import threading
 from pathlib import Path
 
 import yaml
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
 
-from whatsvector.data.loaders.loader import (
+from whatsvector.common.constants import (
     DEFAULT_COLLECTION_NAME,
     DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_QDRANT_GRPC_PORT,
 )
 
+try:
+    # orjson is much faster than the standard library for the JSON sidecar.
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+try:
+    # libyaml-backed loader/dumper, much faster than the pure-Python ones.
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
+# Parsed configurations keyed by file path, with the mtime they were read at.
+_CACHE: dict[str, tuple[float, "Config"]] = {}
+_CACHE_LOCK = threading.Lock()
+
 
 class Config(BaseModel):
     """
@@ -18,18 +47,31 @@ class Config(BaseModel):
         qdrant_host (str): The Qdrant host address.
         qdrant_port (int): The Qdrant port number.
         qdrant_api_key (str): The Qdrant API key.
+        qdrant_grpc_port (int): The Qdrant gRPC port number.
+        qdrant_prefer_grpc (bool): Whether to talk to Qdrant over gRPC instead of REST.
         embedding_model (str): The embedding model to use.
         collection_name (str): The name of the Qdrant collection.
     """
 
+    # Loaded configurations are cached and shared, they must not be mutated.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     qdrant_host: str | None = None
     qdrant_port: int | None = 6333
+    qdrant_grpc_port: int = DEFAULT_QDRANT_GRPC_PORT
+    qdrant_prefer_grpc: bool = True
     qdrant_api_key: str | None = None
     qdrant_https: bool = False
     qdrant_local_path: str | None = None
     embedding_model: str = DEFAULT_EMBEDDING_MODEL
     collection_name: str = DEFAULT_COLLECTION_NAME
 
+    @field_validator("qdrant_grpc_port", mode="before")
+    @classmethod
+    def _default_grpc_port(cls, value):
+        # Profiles may have an explicit null, use the default port for it.
+        return DEFAULT_QDRANT_GRPC_PORT if value is None else value
+
 
 class ConfigFile:
     """Handles loading and saving configuration to a YAML file."""
@@ -37,6 +79,15 @@ class ConfigFile:
     def __init__(self, file_path: str = ".whatsvector/default.yaml") -> None:
         self.file_path = file_path
 
+    @property
+    def cache_path(self) -> str:
+        """
+        Path of the JSON sidecar caching the parsed YAML file.
+        Returns:
+            str: The sidecar file path.
+        """
+        return f"{self.file_path}.cache.json"
+
     @staticmethod
     def exists(profile: str) -> bool:
         """
@@ -46,23 +97,37 @@ class ConfigFile:
         Returns:
             bool: True if the configuration file exists, False otherwise.
         """
-        config_path = Path(f".whatsvector/{profile}.yaml")
-        return config_path.exists()
+        return os.path.exists(f".whatsvector/{profile}.yaml")
 
     def load(self) -> Config:
         """
         Load configuration from a YAML file.
+        The parsed configuration is cached in memory for as long as the file
+        mtime does not change, and in a JSON sidecar next to the YAML file
+        so that later runs can skip the YAML parser.
         Returns:
             Config: The loaded configuration object.
         """
-
-        if not Path(self.file_path).exists():
+        try:
+            mtime = os.stat(self.file_path).st_mtime
+        except FileNotFoundError:
             raise FileNotFoundError(f"Config file {self.file_path} not found.")
 
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        with _CACHE_LOCK:
+            cached = _CACHE.get(self.file_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        config = self._load_cache(mtime)
+        if config is None:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                data = yaml.load(f, Loader=_Loader)
+            config = Config(**data)
+            self._write_cache(config)
 
-        return Config(**data)
+        with _CACHE_LOCK:
+            _CACHE[self.file_path] = (mtime, config)
+        return config
 
     def save(self, config: Config) -> None:
         """
@@ -73,4 +138,48 @@ class ConfigFile:
         Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
 
         with open(self.file_path, "w", encoding="utf-8") as f:
-            yaml.dump(config.model_dump(), f)
+            yaml.dump(config.model_dump(), f, Dumper=_Dumper)
+
+        with _CACHE_LOCK:
+            _CACHE.pop(self.file_path, None)
+        try:
+            os.remove(self.cache_path)
+        except FileNotFoundError:
+            pass
+
+    def _load_cache(self, mtime: float) -> Config | None:
+        """
+        Load configuration from the JSON sidecar, if it is up to date.
+        Args:
+            mtime (float): The mtime of the YAML file.
+        Returns:
+            Config | None: The cached configuration, or None if the sidecar
+                is missing, stale or unreadable.
+        """
+        try:
+            if os.stat(self.cache_path).st_mtime < mtime:
+                return None
+            with open(self.cache_path, "rb") as f:
+                return Config.model_validate(_loads(f.read()))
+        except (OSError, ValueError, ValidationError):
+            # Unreadable, corrupted or hand-edited sidecar, or one written by
+            # an older schema: fall back to the YAML file.
+            return None
+
+    def _write_cache(self, config: Config) -> None:
+        """
+        Atomically write the JSON sidecar for the given configuration.
+        Args:
+            config (Config): The configuration object to cache.
+        """
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(config.model_dump()))
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # The sidecar is only an optimization, never fail the load for it.
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
@@ -1,33 +1,49 @@
 """Data loader classes."""
 
+import asyncio
 import os
 from abc import ABC, abstractmethod
 
-from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 
+from whatsvector.common.cache import search_cache
+from whatsvector.common.constants import (
+    DEFAULT_COLLECTION_NAME,
+    DEFAULT_EMBEDDING_MODEL,
+    DEFAULT_QDRANT_GRPC_PORT,
+    QuantizationType,
+)
+from whatsvector.common.embedding import get_text_embedding
 from whatsvector.common.log import app_logger as logging
 from whatsvector.exceptions.data import InvalidRowError
 from whatsvector.types.data import WhatsappData
 
-# The default embedding model is jinaai/jina-embeddings-v3 because it's good for multilingual data.
-DEFAULT_EMBEDDING_MODEL = "jinaai/jina-embeddings-v3"
-DEFAULT_COLLECTION_NAME = "whatsvector_collection"
-
 
 class DataLoader(ABC):
     """Abstract base class for data loaders."""
 
+    # Whether _load must be called one file at a time in wa_files order, the
+    # files are parsed concurrently either way.
+    ordered: bool = False
+
     def __init__(
-        self, wa_files: list[str], *args, raise_errors: bool = False, **kwargs
+        self,
+        wa_files: list[str],
+        *args,
+        raise_errors: bool = False,
+        max_concurrency: int = 4,
+        **kwargs,
     ) -> None:
         """
         Abstract base class for data loaders.
         Args:
             wa_files (list[str]): List of WhatsApp data file paths.
             raise_errors (bool): Whether to raise errors during loading.
+            max_concurrency (int): Maximum number of files loaded at the same time.
         """
         self.wa_files = wa_files
         self.raise_errors = raise_errors
+        self.max_concurrency = max(1, max_concurrency)
 
     @abstractmethod
     async def _load(self, wa_data: WhatsappData) -> None:
@@ -52,31 +68,57 @@ class DataLoader(ABC):
         Raises:
             InvalidRowError: If a row in the data is invalid and raise_errors is True.
         """
-        iterator = self.wa_files
-        if progress:
-            iterator = tqdm(
-                self.wa_files,
-                desc="Loading WhatsApp data files",
-                unit="file",
-                total=len(self.wa_files),
-            )
-        for wa_file in iterator:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Set once the _load of each file is done, or the file was skipped, and
+        # for ordered loaders once the same holds for all the previous files.
+        loaded = [asyncio.Event() for _ in self.wa_files]
+
+        async def _load_file(index: int, wa_file: str) -> None:
             try:
-                data = WhatsappData.from_txt_file(wa_file)
-                logging.info(
-                    f"Loading {len(data.clean_messages)} messages from {wa_file}."
-                )
-                await self._load(data)
+                async with semaphore:
+                    # Parsing is blocking, run it in a thread so that it overlaps
+                    # with the loading of the other files.
+                    data = await asyncio.to_thread(WhatsappData.from_txt_file, wa_file)
+                    logging.info(
+                        f"Loading {len(data.clean_messages)} messages from {wa_file}."
+                    )
+                    if self.ordered and index > 0:
+                        await loaded[index - 1].wait()
+                    await self._load(data)
             except InvalidRowError as e:
                 if self.raise_errors:
                     raise e
-                else:
-                    continue
+            finally:
+                # A skipped file still waits for its predecessor, so that the
+                # next file does not get ahead of it.
+                if self.ordered and index > 0:
+                    await loaded[index - 1].wait()
+                loaded[index].set()
+
+        # Tasks are created here, in wa_files order, so that they take the
+        # semaphore in that order whatever order gather awaits them in: an
+        # ordered file never waits for a predecessor that has no slot.
+        tasks = [
+            asyncio.create_task(_load_file(i, wa_file))
+            for i, wa_file in enumerate(self.wa_files)
+        ]
+        if progress:
+            await tqdm_asyncio.gather(
+                *tasks,
+                desc="Loading WhatsApp data files",
+                unit="file",
+                total=len(tasks),
+            )
+        else:
+            await asyncio.gather(*tasks)
 
 
 class InMemoryDataLoader(DataLoader):
     """In-memory data loader implementation."""
 
+    # data_storage follows wa_files.
+    ordered = True
+
     def __init__(
         self, wa_files: list[str], *args, raise_errors: bool = False, **kwargs
     ) -> None:
@@ -117,11 +159,14 @@ class QdrantDataLoader(DataLoader):
         raise_errors: bool = False,
         host: str = "localhost",
         port: int = 6333,
+        grpc_port: int = DEFAULT_QDRANT_GRPC_PORT,
+        prefer_grpc: bool = True,
         https: bool = False,
         api_key: str | None = None,
         local_path: str | None = None,
         embedding_model: str = DEFAULT_EMBEDDING_MODEL,
         collection_name: str = DEFAULT_COLLECTION_NAME,
+        quantization: QuantizationType = "scalar",
         **kwargs,
     ) -> None:
         """
@@ -131,11 +176,17 @@ class QdrantDataLoader(DataLoader):
             raise_errors (bool): Whether to raise errors during loading.
             host (str): Qdrant host.
             port (int): Qdrant port.
+            grpc_port (int): Qdrant gRPC port.
+            prefer_grpc (bool): Whether to use gRPC instead of REST, protobuf
+                encoding of the vectors is much cheaper than JSON.
             https (bool): Whether to use HTTPS.
             api_key (str | None): Qdrant API key.
             local_path (str | None): Local path for Qdrant, if provided a local instance will be used.
             embedding_model (str): The embedding model to use.
             collection_name (str): The name of the Qdrant collection.
+            quantization (QuantizationType): Quantization of the collection vectors,
+                only used when the collection is created. Scalar quantization keeps
+                ~99% recall, binary is faster and smaller at the cost of accuracy.
         """
         super().__init__(wa_files=wa_files, *args, raise_errors=raise_errors, **kwargs)
         try:
@@ -146,6 +197,8 @@ class QdrantDataLoader(DataLoader):
             ) from e
         self.collection_name = collection_name
         self.embedding_model = embedding_model
+        self.quantization = quantization
+        self._local = local_path is not None
         if local_path is not None:
             logging.warning(
                 "Local path provided, using local Qdrant instance. Host, port, https, and api_key parameters will be ignored."
@@ -158,19 +211,21 @@ class QdrantDataLoader(DataLoader):
         self._client = AsyncQdrantClient(
             host=host,
             port=port,
+            grpc_port=grpc_port,
+            prefer_grpc=prefer_grpc,
             https=https,
             api_key=api_key,
             path=local_path,
         )
 
-        self._client.set_model(embedding_model_name=embedding_model)
+        # No set_model: messages are embedded with get_text_embedding, the
+        # client would only load a second, unused copy of the model.
+        # Files are loaded concurrently, only one of them may create the collection.
+        self._collection_lock = asyncio.Lock()
+        self._collection_ready = False
 
-    async def _load(self, wa_data: WhatsappData) -> None:
-        """
-        Load data into Qdrant.
-        Args:
-            wa_data (WhatsappData): The WhatsApp data to load.
-        """
+    async def _ensure_collection(self) -> None:
+        """Create the Qdrant collection if it does not exist yet."""
         import qdrant_client.models as models
 
         if not await self._client.collection_exists(self.collection_name):
@@ -182,32 +237,87 @@ class QdrantDataLoader(DataLoader):
                 vectors_config=models.VectorParams(
                     size=self._client.get_embedding_size(model_name=self.embedding_model),
                     distance=models.Distance.COSINE,
+                    # With quantization the original vectors are only read to rescore.
+                    on_disk=self.quantization != "none",
                 ),
+                quantization_config=self._quantization_config(),
+            )
+
+    def _quantization_config(self):
+        """
+        Build the Qdrant quantization config for the collection.
+        Returns:
+            models.QuantizationConfig | None: The quantization config, None if disabled.
+        """
+        import qdrant_client.models as models
+
+        if self.quantization == "scalar":
+            return models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=0.99,
+                    always_ram=True,
+                )
             )
+        if self.quantization == "binary":
+            return models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True)
+            )
+        return None
+
+    async def _load(self, wa_data: WhatsappData) -> None:
+        """
+        Load data into Qdrant.
+        Args:
+            wa_data (WhatsappData): The WhatsApp data to load.
+        """
+        async with self._collection_lock:
+            if not self._collection_ready:
+                await self._ensure_collection()
+                self._collection_ready = True
 
-        metadata = [
+        # Both the payloads and the vectors are streamed to the uploader, so
+        # only the batches in flight are kept in memory instead of the whole
+        # file worth of embeddings.
+        messages = wa_data.clean_messages
+        texts = [msg.rich_content for msg in messages]
+        metadata = (
             {
                 "sender": msg.sender,
                 "when": msg.message_date.isoformat(),
-                "content": msg.rich_content,
-                "document": msg.rich_content,
+                "content": rich_content,
             }
-            for msg in wa_data.clean_messages
-        ]
+            for msg, rich_content in zip(messages, texts)
+        )
         processes = os.cpu_count() // 2
         if processes < 1:
             processes = 1
 
-        self._client.upload_collection(
-            collection_name=self.collection_name,
-            vectors=[
-                models.Document(text=msg.rich_content, model=self.embedding_model)
-                for msg in wa_data.clean_messages
-            ],
-            payload=metadata,
-            parallel=processes,
-            batch_size=128,
-        )
+        def _upload() -> None:
+            # Messages are embedded in large batches instead of letting the
+            # client run inference on one Document at a time.
+            embedder = get_text_embedding(self.embedding_model)
+            vectors = (
+                vector.tolist() for vector in embedder.embed(texts, batch_size=256)
+            )
+            self._client.upload_collection(
+                collection_name=self.collection_name,
+                vectors=vectors,
+                payload=metadata,
+                parallel=processes,
+                batch_size=128,
+            )
+
+        if self._local:
+            # The local instance and its SQLite storage are not thread safe,
+            # local uploads stay on the event loop thread, one at a time.
+            _upload()
+        else:
+            # Loading the model, embedding and uploading are blocking, run them
+            # in a thread so that the uploads of concurrent files overlap.
+            await asyncio.to_thread(_upload)
+        # Cached searches may not include the points just uploaded.
+        search_cache.clear()
         logging.info(
             f"Loaded {len(wa_data.clean_messages)} messages into collection {self.collection_name}."
         )
@@ -1,49 +1,126 @@
 """Module defining data types for WhatsApp data processing."""
 
 import re
+import sys
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from functools import cached_property
+from functools import lru_cache
 from typing import Literal
 
-from pydantic import BaseModel, Field
-
 from whatsvector.exceptions.data import InvalidRowError
 
 KNOWN_NOT_FOUND_PLACEHOLDERS = {
-    "it": {
-        "immagine omessa",
-        "video omesso",
-        "audio omesso",
-        "documento omesso",
-    },
-    "en": {"image omitted", "video omitted", "audio omitted", "document omitted"},
+    "it": frozenset(
+        {
+            "immagine omessa",
+            "video omesso",
+            "audio omesso",
+            "documento omesso",
+        }
+    ),
+    "en": frozenset(
+        {"image omitted", "video omitted", "audio omitted", "document omitted"}
+    ),
 }
 
+# A chat line: "[DD/MM/YY, HH:MM:SS] sender: content". The timestamp has a fixed
+# layout, it is captured whole with its date nested in it, so that neither has
+# to be rebuilt or sliced in Python.
+_TIMESTAMP_PATTERN = r"((\d{2}/\d{2}/\d{2}), \d{2}:\d{2}:\d{2})"
+_LINE_RE = re.compile(rf"^\[{_TIMESTAMP_PATTERN}\] (.*?): (.*)$")
+# The same line matched inside a whole export, ignoring surrounding whitespace
+# like the lines stripped before calling WhatsappMessage.from_raw.
+_LINES_RE = re.compile(
+    rf"^[^\S\n]*\[{_TIMESTAMP_PATTERN}\] (.*?): (.*\S)[^\S\n]*$",
+    re.MULTILINE,
+)
+
+
+def _parse_date(date_str: str) -> datetime:
+    """
+    Parse a "DD/MM/YY" date, much faster than datetime.strptime.
+    Args:
+        date_str (str): The date string.
+    Returns:
+        datetime: The parsed date.
+    Raises:
+        ValueError: If the date string is not a valid date.
+    """
+    day, month, year = date_str.split("/")
+    year = int(year)
+    # Same two-digit year pivot as strptime's %y: 69-99 -> 1900s, 00-68 -> 2000s.
+    year += 1900 if year >= 69 else 2000
+    return datetime(year, int(month), int(day))
+
+
+_WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+_MONTHS = (
+    None,
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
 
-class WhatsappMessage(BaseModel):
+
+# Chats have far fewer distinct days than messages, so each day is formatted once.
+@lru_cache(maxsize=None)
+def _format_date(year: int, month: int, day: int) -> str:
+    """
+    Format a message date for the rich content, without going through strftime.
+    Args:
+        year (int): The year of the date.
+        month (int): The month of the date.
+        day (int): The day of the date.
+    Returns:
+        str: The date formatted as "Weekday, DD Month YYYY".
+    """
+    weekday = _WEEKDAYS[datetime(year, month, day).weekday()]
+    return f"{weekday}, {day:02d} {_MONTHS[month]} {year}"
+
+
+@dataclass(slots=True)
+class WhatsappMessage:
     """
     Class representing a WhatsApp message.
+    A slotted dataclass rather than a pydantic model: one is built per chat line
+    from already validated regex groups, so validation would be wasted work.
     Attributes:
-        timestamp (str): The timestamp of the message.
+        timestamp (str): The timestamp of the message in the format "DD/MM/YY, HH:MM:SS".
         sender (str): The sender of the message.
         content (str): The content of the message.
+        message_date (datetime): The date part of the timestamp, parsed from the
+            timestamp when not given.
     """
 
-    timestamp: str = Field(
-        ..., description="The timestamp of the message in the format [DD/MM/YY, HH:MM:SS]"
-    )
-    sender: str = Field(..., description="The sender of the message")
-    content: str = Field(..., description="The content of the message")
+    timestamp: str
+    sender: str
+    content: str
+    message_date: datetime | None = field(default=None, repr=False, compare=False)
 
-    @cached_property
-    def message_date(self) -> datetime:
-        """
-        Get the date part of the timestamp.
-        Returns:
-            datetime: The date of the message.
-        """
-        date_str = self.timestamp.split(",")[0].strip("[] ")
-        return datetime.strptime(date_str, "%d/%m/%y")
+    def __post_init__(self) -> None:
+        # Parsed once here rather than on every access, callers that already
+        # split the timestamp pass it directly.
+        if self.message_date is None:
+            date_str = self.timestamp.split(",", 1)[0].strip("[] ")
+            self.message_date = _parse_date(date_str)
 
     @property
     def rich_content(self) -> str:
@@ -54,7 +131,8 @@ class WhatsappMessage(BaseModel):
         """
 
         # when must contains also the weekday name for better context in the vectorization
-        date_str = self.message_date.strftime("%A, %d %B %Y")
+        message_date = self.message_date
+        date_str = _format_date(message_date.year, message_date.month, message_date.day)
         return f"Sender: {self.sender}\nWhen: {date_str}\nMessage: {self.content}"
 
     @classmethod
@@ -68,19 +146,35 @@ class WhatsappMessage(BaseModel):
         Raises:
             InvalidRowError: If the raw message does not match the expected format.
         """
-        pattern = r"^\[(\d{2}/\d{2}/\d{2}), (\d{2}:\d{2}:\d{2})\] (.*?): (.*)$"
-        match = re.match(pattern, raw_message)
+        match = _LINE_RE.match(raw_message)
         if not match:
             raise InvalidRowError(
                 row=raw_message, reason="Message does not match expected format."
             )
-        date, time, sender, content = match.groups()
-        timestamp = f"{date}, {time}"
-        return cls(timestamp=timestamp, sender=sender, content=content)
+        timestamp, date, sender, content = match.groups()
+        try:
+            message_date = _parse_date(date)
+        except ValueError as e:
+            raise InvalidRowError(
+                row=raw_message, reason="Message date is not valid."
+            ) from e
+        return cls(
+            timestamp=timestamp,
+            sender=sys.intern(sender),
+            content=content,
+            message_date=message_date,
+        )
 
 
-class WhatsappData:
-    """Class representing WhatsApp data."""
+class WhatsappData(Sequence[WhatsappMessage]):
+    """
+    Class representing WhatsApp data.
+    It is a sequence of its messages, tight loops should rather go through the
+    messages list directly to skip the delegation.
+    Attributes:
+        messages (list[WhatsappMessage]): The messages, in chat order.
+        not_found_placeholders (frozenset[str]): Placeholders for omitted media.
+    """
 
     def __init__(
         self,
@@ -97,11 +191,17 @@ class WhatsappData:
             not_found_placeholders (list[str]): List of placeholders for omitted media.
         """
         self.messages = messages
+        # Always a frozenset: O(1) membership checks when filtering, and the
+        # known placeholders can be shared without copying them.
         self.not_found_placeholders = (
-            not_found_placeholders
+            frozenset(not_found_placeholders)
             if not_found_placeholders is not None
-            else KNOWN_NOT_FOUND_PLACEHOLDERS[app_language].copy()
+            else KNOWN_NOT_FOUND_PLACEHOLDERS[app_language]
         )
+        # Computed on first access, unless from_txt_file already built them
+        # while parsing.
+        self._clean_messages: list[WhatsappMessage] | None = None
+        self._senders: set[str] | None = None
 
     @classmethod
     def from_txt_file(
@@ -117,36 +217,67 @@ class WhatsappData:
         Returns:
             WhatsappData: The created WhatsappData instance.
         """
-        not_found_placeholders = KNOWN_NOT_FOUND_PLACEHOLDERS[app_language].copy()
-
+        # Read the raw bytes in one go and decode them once, instead of going
+        # through the line-buffered text wrapper. The bytes are dropped as soon
+        # as they are decoded, only the text is alive while matching.
+        with open(file_path, "rb") as file:
+            text = file.read().decode("utf-8")
+        if "\r" in text:
+            # Same universal newlines translation as text mode.
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        # A single regex pass over the whole export, invalid rows are skipped
+        # since they simply do not match.
+        rows = _LINES_RE.findall(text)
+        # Only the rows are needed from here on, free the text before the
+        # messages are built on top of them.
+        del text
+        # Parse the date column once per distinct day instead of once per row,
+        # the messages of the same day then share the same datetime object.
+        dates = {}
+        for date in {row[1] for row in rows}:
+            try:
+                dates[date] = _parse_date(date)
+            except ValueError:
+                dates[date] = None  # Rows with an invalid date are skipped
+        # Messages, clean messages and senders are all built in this one pass.
+        placeholders = KNOWN_NOT_FOUND_PLACEHOLDERS[app_language]
         messages = []
-        with open(file_path, "r", encoding="utf-8") as file:
-            for line in file:
-                line = line.strip()
-                if line:
-                    try:
-                        message = WhatsappMessage.from_raw(line)
-                        messages.append(message)
-                    except InvalidRowError:
-                        continue  # Skip invalid rows
-        return cls(
-            messages=messages,
-            app_language=app_language,
-            not_found_placeholders=not_found_placeholders,
-        )
+        clean_messages = []
+        senders = set()
+        for timestamp, date, sender, content in rows:
+            message_date = dates[date]
+            if message_date is None:
+                continue
+            # A chat has a handful of senders for thousands of messages,
+            # interning makes them share one string each.
+            sender = sys.intern(sender)
+            # Positional arguments, the keyword ones cost a lot in the
+            # generated __init__ at one call per message.
+            message = WhatsappMessage(timestamp, sender, content, message_date)
+            messages.append(message)
+            if content not in placeholders:
+                clean_messages.append(message)
+            senders.add(sender)
+
+        data = cls(messages=messages, app_language=app_language)
+        data._clean_messages = clean_messages
+        data._senders = senders
+        return data
 
-    @cached_property
+    @property
     def clean_messages(self) -> list[WhatsappMessage]:
         """
         Get a list of messages excluding those with content in not_found_placeholders.
         Returns:
             list[WhatsappMessage]: A list of clean WhatsApp messages.
         """
-        return [
-            message
-            for message in self.messages
-            if message.content not in self.not_found_placeholders
-        ]
+        if self._clean_messages is None:
+            self._clean_messages = [
+                message
+                for message in self.messages
+                if message.content not in self.not_found_placeholders
+            ]
+        return self._clean_messages
 
     @property
     def senders(self) -> set[str]:
@@ -155,7 +286,9 @@ class WhatsappData:
         Returns:
             set[str]: A set of unique senders.
         """
-        return set(message.sender for message in self.messages)
+        if self._senders is None:
+            self._senders = {message.sender for message in self.messages}
+        return self._senders
 
     @property
     def total_messages(self) -> int:
@@ -175,13 +308,21 @@ class WhatsappData:
         """
         return len(self.clean_messages)
 
-    def __iter__(self):
-        return iter(self.messages)
+    def __iter__(self) -> Iterator[WhatsappMessage]:
+        return self.messages.__iter__()
+
+    def __reversed__(self) -> Iterator[WhatsappMessage]:
+        return self.messages.__reversed__()
+
+    def __contains__(self, message: object) -> bool:
+        return message in self.messages
 
-    def __len__(self):
+    def __len__(self) -> int:
         return len(self.messages)
 
-    def __getitem__(self, index: int) -> WhatsappMessage:
+    def __getitem__(
+        self, index: int | slice
+    ) -> WhatsappMessage | list[WhatsappMessage]:
         return self.messages[index]
 
     def __repr__(self) -> str: